@@ -0,0 +1,174 @@
+"""Optional io_uring copy backend for batched backups.
+
+Wraps the `liburing` binding so dir_ops.sync can submit many read/write
+operations to the kernel in batches instead of one synchronous copy per
+file. Import of this module always succeeds; callers must check
+available() and keep the synchronous path as a fallback — liburing is an
+optional dependency and io_uring needs kernel 5.6 or newer.
+"""
+
+import os
+from typing import Iterable, List, Tuple
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Kernel 5.6 introduced the openat/read/write opcodes we rely on
+_MIN_KERNEL = (5, 6)
+
+# Submission queue depth and how many files share one submit round
+_QUEUE_DEPTH = 256
+_MAX_BATCH = 64
+
+# Staging buffer per in-flight file
+_BUF_SIZE = 1 << 20
+
+
+def available() -> bool:
+    """Check whether the io_uring copy path can be used."""
+    if liburing is None:
+        return False
+
+    try:
+        release = os.uname().release.split("-")[0]
+        kernel = tuple(int(part) for part in release.split(".")[:2])
+    except (AttributeError, ValueError):
+        return False
+
+    return kernel >= _MIN_KERNEL
+
+
+def copy_files(pairs: Iterable[Tuple[str, str]]) -> int:
+    """Copy (source, dest) file pairs with batched io_uring I/O.
+
+    Files are processed in batches of up to _MAX_BATCH: one read SQE per
+    file is submitted and reaped, then the matching writes, so syscall
+    and device round trips overlap across the batch instead of being
+    paid once per file.
+
+    Returns:
+        Number of files copied
+
+    Raises:
+        OSError: If the ring cannot be set up or an operation fails;
+            callers fall back to the synchronous copy path
+    """
+    import shutil
+
+    pairs = list(pairs)
+
+    ring = liburing.io_uring()
+    if liburing.io_uring_queue_init(_QUEUE_DEPTH, ring, 0) < 0:
+        raise OSError("io_uring_queue_init failed")
+
+    copied = 0
+
+    try:
+        for start in range(0, len(pairs), _MAX_BATCH):
+            copied += _copy_batch(ring, pairs[start:start + _MAX_BATCH])
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+    for source, dest in pairs:
+        shutil.copystat(source, dest)
+
+    return copied
+
+
+def _copy_batch(ring, batch: List[Tuple[str, str]]) -> int:
+    """Copy one batch of file pairs over an initialized ring."""
+    fds = []
+    try:
+        for source, dest in batch:
+            in_fd = os.open(source, os.O_RDONLY)
+            try:
+                out_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            except OSError:
+                os.close(in_fd)
+                raise
+            fds.append((in_fd, out_fd))
+
+        buffers = [bytearray(_BUF_SIZE) for _ in batch]
+        iovecs = [liburing.iovec(buf) for buf in buffers]
+        offsets = [0] * len(batch)
+        done = [False] * len(batch)
+
+        while not all(done):
+            # One read per unfinished file, submitted together
+            pending = []
+            for i, (in_fd, _) in enumerate(fds):
+                if done[i]:
+                    continue
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_readv(sqe, in_fd, iovecs[i], 1, offsets[i])
+                sqe.user_data = i
+                pending.append(i)
+
+            read_sizes = dict(_submit_and_reap(ring, len(pending)))
+
+            # Matching writes for every read that returned data. The sliced
+            # buffers and iovecs must stay referenced until the completions
+            # are reaped — the kernel reads them at submit time, after this
+            # loop has finished.
+            writes = []
+            write_bufs = []
+            write_vecs = []
+            for i in pending:
+                size = read_sizes.get(i, 0)
+                if size <= 0:
+                    done[i] = True
+                    continue
+                buf = buffers[i][:size]
+                vec = liburing.iovec(buf)
+                write_bufs.append(buf)
+                write_vecs.append(vec)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_writev(sqe, fds[i][1], vec, 1, offsets[i])
+                sqe.user_data = i
+                writes.append((i, size))
+
+            write_sizes = dict(_submit_and_reap(ring, len(writes)))
+            del write_bufs, write_vecs
+
+            for i, size in writes:
+                if write_sizes.get(i) != size:
+                    raise OSError(f"short write copying to {batch[i][1]}")
+                offsets[i] += size
+                if size < _BUF_SIZE:
+                    done[i] = True
+    finally:
+        for in_fd, out_fd in fds:
+            os.close(in_fd)
+            os.close(out_fd)
+
+    return len(batch)
+
+
+def _submit_and_reap(ring, count: int) -> List[Tuple[int, int]]:
+    """Submit queued SQEs and wait for `count` completions.
+
+    Returns:
+        List of (user_data, result) tuples
+
+    Raises:
+        OSError: If any completion carries an error result
+    """
+    if count == 0:
+        return []
+
+    liburing.io_uring_submit(ring)
+
+    results = []
+    cqe = liburing.io_uring_cqe()
+
+    for _ in range(count):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        if cqe.res < 0:
+            liburing.io_uring_cqe_seen(ring, cqe)
+            raise OSError(-cqe.res, os.strerror(-cqe.res))
+        results.append((cqe.user_data, cqe.res))
+        liburing.io_uring_cqe_seen(ring, cqe)
+
+    return results
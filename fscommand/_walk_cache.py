@@ -0,0 +1,105 @@
+"""Opt-in cache of directory listings for repeated tree walks.
+
+Workflows like backup_project walk the same tree several times in one
+process (sync, then find_large_files). With FSCOMMAND_WALK_CACHE=1,
+listings are cached per directory keyed by (path, st_mtime_ns); touching
+a directory changes its mtime, so stale entries miss on the next call
+without any explicit invalidation. Disabled (the default), scandir()
+is a plain passthrough.
+"""
+
+import os
+import errno
+import functools
+from typing import List
+
+
+class CachedEntry:
+    """Immutable snapshot of an os.DirEntry.
+
+    Answers the same hot-path queries (name, path, type checks, stat)
+    without touching the filesystem again, honoring follow_symlinks so
+    cached and live walks classify symlinks identically. A broken
+    symlink is kept — its follow-stat raises on access, as DirEntry's
+    would.
+    """
+
+    __slots__ = (
+        "name", "path",
+        "_is_dir", "_is_dir_follow",
+        "_is_file", "_is_file_follow",
+        "_is_symlink", "_stat", "_lstat",
+    )
+
+    def __init__(self, entry: os.DirEntry):
+        self.name = entry.name
+        self.path = entry.path
+        self._is_dir = entry.is_dir(follow_symlinks=False)
+        self._is_dir_follow = entry.is_dir()
+        self._is_file = entry.is_file(follow_symlinks=False)
+        self._is_file_follow = entry.is_file()
+        self._is_symlink = entry.is_symlink()
+        self._lstat = entry.stat(follow_symlinks=False)
+        try:
+            self._stat = entry.stat()
+        except (OSError, IOError):
+            self._stat = None
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return self._is_dir_follow if follow_symlinks else self._is_dir
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return self._is_file_follow if follow_symlinks else self._is_file
+
+    def is_symlink(self) -> bool:
+        return self._is_symlink
+
+    def stat(self, follow_symlinks: bool = True):
+        if not follow_symlinks:
+            return self._lstat
+        if self._stat is None:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), self.path)
+        return self._stat
+
+
+def enabled() -> bool:
+    """Check whether the walk cache is switched on for this process."""
+    return os.environ.get("FSCOMMAND_WALK_CACHE") == "1"
+
+
+@functools.lru_cache(maxsize=4096)
+def _scan(path: str, mtime_ns: int) -> tuple:
+    # mtime_ns is only part of the key; a changed directory gets a fresh slot
+    entries = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    entries.append(CachedEntry(entry))
+                except (OSError, IOError):
+                    continue
+    except (OSError, IOError):
+        pass
+    return tuple(entries)
+
+
+def scandir(path: str) -> List:
+    """List a directory, serving repeat calls from memory when enabled.
+
+    Returns:
+        List of os.DirEntry (cache disabled) or CachedEntry objects;
+        both answer name/path/is_dir/is_file/is_symlink/stat
+
+    Raises:
+        OSError: If the directory cannot be read while the cache is
+            disabled (cache hits for unreadable paths return empty)
+    """
+    if enabled():
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except (OSError, IOError):
+            return []
+        return list(_scan(path, mtime_ns))
+
+    with os.scandir(path) as it:
+        return list(it)
@@ -115,10 +115,14 @@ def make_directory(
 def tree_view(
     path: str = typer.Argument(".", help="Root directory path"),
     max_depth: int = typer.Option(3, "--depth", "-d", help="Maximum depth to display"),
+    rich_tree: bool = typer.Option(False, "--rich", help="Render with Rich tree nodes"),
 ):
     """Display directory tree structure."""
-    tree = dir_ops.tree(path, max_depth=max_depth)
-    console.print(tree)
+    # Deep trees skip Rich's per-entry node objects and render pass
+    if rich_tree or max_depth <= 2:
+        console.print(dir_ops.tree(path, max_depth=max_depth))
+    else:
+        print(dir_ops.render_tree(path, max_depth=max_depth), end="")
 
 
 @app.command("sync")
@@ -127,9 +131,10 @@ def sync_dirs(
     dest: str = typer.Argument(..., help="Destination directory"),
     delete: bool = typer.Option(False, "--delete", help="Delete extra files in destination"),
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Show what would be done"),
+    hardlink: bool = typer.Option(False, "--hardlink", help="Hardlink instead of copying on the same filesystem"),
 ):
     """Synchronize two directories."""
-    result = dir_ops.sync(source, dest, delete=delete, dry_run=dry_run)
+    result = dir_ops.sync(source, dest, delete=delete, dry_run=dry_run, hardlink=hardlink)
     
     if dry_run:
         console.print("[yellow]Dry run - no changes made[/yellow]")
@@ -195,9 +200,15 @@ def search_content(
     path: str = typer.Argument(".", help="Search root path"),
     include: str = typer.Option("*.txt", "--include", help="Glob pattern for files to include"),
     exclude: str = typer.Option(None, "--exclude", help="Glob pattern for files to exclude"),
+    workers: int = typer.Option(None, "--workers", "-w", help="Number of scan threads (default: 2x CPU count)"),
+    text_only: bool = typer.Option(True, "--text-only/--binary", help="Skip files that sniff as binary"),
+    multi: bool = typer.Option(False, "--multi", help="Treat pattern as comma-separated patterns"),
 ):
     """Search for text pattern in files."""
-    results = search.search_text(pattern, path, include=include, exclude=exclude)
+    results = search.search_text(
+        pattern, path, include=include, exclude=exclude,
+        max_workers=workers, text_only=text_only, multi=multi,
+    )
     
     if not results:
         console.print("[yellow]No matches found[/yellow]")
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Example workflow - Backup project files using fscommand modules."""
 
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-from fscommand import dir_ops, file_ops, search
+from fscommand import dir_ops, search
 
 
 def backup_project(source_dir: str, backup_dir: str, keep_days: int = 7):
@@ -41,24 +44,35 @@ def cleanup_old_backups(backup_base: Path, keep_days: int):
     """Remove backups older than specified days."""
     if not backup_base.exists():
         return
-    
+
     now = datetime.now()
-    
-    for backup_dir in backup_base.glob("backup_*"):
-        if not backup_dir.is_dir():
-            continue
-        
-        # Extract timestamp from directory name
-        try:
-            timestamp_str = backup_dir.name.replace("backup_", "")
-            backup_date = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+    expired = []
+
+    with os.scandir(backup_base) as it:
+        for entry in it:
+            if not entry.name.startswith("backup_"):
+                continue
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+
+            # The timestamp lives in the name; no stat needed
+            try:
+                backup_date = datetime.strptime(entry.name[7:], "%Y%m%d_%H%M%S")
+            except ValueError:
+                continue
+
             age_days = (now - backup_date).days
-            
             if age_days > keep_days:
-                print(f"  Removing old backup: {backup_dir.name} ({age_days} days old)")
-                file_ops.remove(str(backup_dir), recursive=True)
-        except ValueError:
-            continue
+                print(f"  Removing old backup: {entry.name} ({age_days} days old)")
+                expired.append(entry.path)
+
+    if not expired:
+        return
+
+    # Each subtree is independent, so the rmtrees can run concurrently
+    with ThreadPoolExecutor(max_workers=min(4, len(expired))) as executor:
+        for path in expired:
+            executor.submit(shutil.rmtree, path, ignore_errors=True)
 
 
 def find_large_files(path: str, min_size: str = "10MB"):
@@ -93,16 +107,31 @@ def organize_downloads(downloads_dir: str):
         "code": ["*.py", "*.js", "*.ts", "*.java", "*.cpp", "*.h", "*.rs"],
     }
     
+    # Flatten the patterns into a suffix -> category map so each file is
+    # classified with one dict lookup during a single directory scan
+    ext_to_cat = {}
     for category, patterns in categories.items():
-        category_dir = downloads / category
-        category_dir.mkdir(exist_ok=True)
-        
+        (downloads / category).mkdir(exist_ok=True)
         for pattern in patterns:
-            for file_path in downloads.glob(pattern):
-                if file_path.is_file():
-                    dest = category_dir / file_path.name
-                    file_ops.move_file(str(file_path), str(dest), overwrite=True)
-                    print(f"  Moved: {file_path.name} → {category}/")
+            ext_to_cat[pattern.rpartition(".")[2].lower()] = category
+
+    with os.scandir(downloads) as it:
+        entries = [e for e in it if e.is_file()]
+
+    for entry in entries:
+        if "." not in entry.name:
+            continue
+
+        category = ext_to_cat.get(entry.name.rpartition(".")[2].lower())
+        if category is None:
+            continue
+
+        # Same-filesystem rename is a single atomic metadata operation
+        try:
+            os.rename(entry.path, os.path.join(str(downloads), category, entry.name))
+        except (OSError, IOError):
+            continue
+        print(f"  Moved: {entry.name} → {category}/")
 
 
 if __name__ == "__main__":
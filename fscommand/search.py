@@ -1,180 +1,448 @@
 """Search and find module - pattern matching, filtering, text search."""
 
+import os
 import re
+import mmap
 import fnmatch
+import operator
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from fscommand import _walk_cache
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# Subtrees that are almost never wanted and often dominate traversal time
+_DEFAULT_EXCLUDE_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv"})
+
+_GLOB_CHARS = frozenset("*?[")
+
 
 def find(
     path: str,
     name: Optional[str] = None,
     size: Optional[str] = None,
     file_type: Optional[str] = None,
+    exclude_dirs: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """Find files and directories matching criteria.
-    
+
     Args:
         path: Search root path
-        name: Glob pattern for file name (e.g., *.py)
+        name: Glob pattern for file name (e.g., *.py); a pattern with a
+            slash (e.g., build/*.o) matches against the path relative to
+            the search root
         size: Filter by size (e.g., >1MB, <100KB)
         file_type: Filter by type (file, dir, link)
-        
+        exclude_dirs: Directory names to prune from the walk (default:
+            .git, node_modules, __pycache__, .venv)
+
     Returns:
         List of matching file info dictionaries
     """
-    root = Path(path)
-    
-    if not root.exists():
+    if not os.path.exists(path):
         return []
-    
+
+    exclude_set = _DEFAULT_EXCLUDE_DIRS if exclude_dirs is None else set(exclude_dirs)
+
     results = []
     size_filter = _parse_size_filter(size) if size else None
-    
-    for item in root.rglob("*"):
-        # Filter by name pattern
-        if name and not fnmatch.fnmatch(item.name, name):
+
+    # Translate the glob once; fnmatch.fnmatch would re-translate (and hit
+    # its pattern cache) on every entry. A slash anchors the pattern to the
+    # relative path, and a wildcard-free directory part lets the walk skip
+    # every subtree that cannot contain a match.
+    name_match = re.compile(fnmatch.translate(name)).match if name else None
+    anchored = name is not None and "/" in name
+    literal_prefix = None
+    if anchored:
+        dir_part = name.rpartition("/")[0]
+        if not _GLOB_CHARS.intersection(dir_part):
+            literal_prefix = dir_part
+
+    # Iterative scandir walk: DirEntry caches type/stat info from the
+    # directory read, avoiding a syscall per check and per-entry Path objects.
+    # Stack entries are (dir_path, path_relative_to_root).
+    stack = [(path, "")]
+
+    while stack:
+        current, rel = stack.pop()
+
+        try:
+            entries = _walk_cache.scandir(current)
+        except (OSError, IOError):
             continue
-        
-        # Filter by type
-        if file_type:
-            if file_type == "file" and not item.is_file():
-                continue
-            elif file_type == "dir" and not item.is_dir():
-                continue
-            elif file_type == "link" and not item.is_symlink():
-                continue
-        
-        # Filter by size
-        if size_filter and item.is_file():
+
+        for entry in entries:
             try:
-                file_size = item.stat().st_size
-                if not _matches_size(file_size, size_filter):
-                    continue
+                is_dir = entry.is_dir(follow_symlinks=False)
             except (OSError, IOError):
                 continue
-        
-        results.append({
-            "path": str(item),
-            "name": item.name,
-            "type": "dir" if item.is_dir() else "file",
-        })
-    
+
+            entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+
+            if is_dir:
+                if entry.name in exclude_set:
+                    continue
+                if literal_prefix is None or _on_prefix_path(literal_prefix, entry_rel):
+                    stack.append((entry.path, entry_rel))
+
+            # Cheapest rejections first: the cached type bits, then the
+            # (cached) stat for size, then the regex name match
+            if file_type:
+                if file_type == "file" and not entry.is_file():
+                    continue
+                elif file_type == "dir" and not is_dir:
+                    continue
+                elif file_type == "link" and not entry.is_symlink():
+                    continue
+
+            if size_filter and entry.is_file():
+                try:
+                    if not size_filter(entry.stat().st_size):
+                        continue
+                except (OSError, IOError):
+                    continue
+
+            if name_match and not name_match(entry_rel if anchored else entry.name):
+                continue
+
+            results.append({
+                "path": entry.path,
+                "name": entry.name,
+                "type": "dir" if is_dir else "file",
+            })
+
     return results
 
 
+def _on_prefix_path(prefix: str, rel: str) -> bool:
+    """Check whether a directory at relative path rel can lead to prefix."""
+    return prefix == rel or prefix.startswith(rel + "/") or rel.startswith(prefix + "/")
+
+
 def search_text(
     pattern: str,
     path: str,
     include: str = "*.txt",
     exclude: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    text_only: bool = True,
+    multi: bool = False,
 ) -> List[Dict[str, Any]]:
     """Search for text pattern in files.
-    
+
+    Per-file scans are independent and I/O-bound, so files are dispatched
+    to a thread pool; the GIL is released during reads and inside the
+    regex engine on bytes, giving real parallelism on multi-file searches.
+
+    Alternation-heavy and multi-pattern searches are handed to Hyperscan
+    when the optional `hyperscan` package is installed: all patterns are
+    compiled into one DFA scanned in a single pass, avoiding Python re
+    backtracking. Without it, multi patterns are joined with | and run
+    through re as usual.
+
     Args:
         pattern: Search pattern (regex supported)
         path: Search root path
         include: Glob pattern for files to include
         exclude: Glob pattern for files to exclude
-        
+        max_workers: Number of scan threads (default: 2x CPU count)
+        text_only: If True, skip files that sniff as binary
+        multi: If True, treat pattern as comma-separated patterns
+
     Returns:
         List of match dictionaries with file, line number, and content
     """
-    root = Path(path)
-    
-    if not root.exists():
+    if not os.path.exists(path):
+        return []
+
+    patterns = [p for p in pattern.split(",") if p] if multi else [pattern]
+    if not patterns:
         return []
-    
+
+    hs_db = None
+    if hyperscan is not None and (multi or "|" in pattern):
+        hs_db = _compile_hyperscan(patterns)
+
+    pattern_bytes = "|".join(patterns).encode("utf-8")
     try:
-        regex = re.compile(pattern, re.IGNORECASE)
+        regex = re.compile(pattern_bytes, re.IGNORECASE | re.MULTILINE)
     except re.error:
         # If regex is invalid, treat as literal
-        regex = re.compile(re.escape(pattern), re.IGNORECASE)
-    
-    results = []
-    
-    for file_path in root.rglob(include):
-        if not file_path.is_file():
-            continue
-        
-        if exclude and fnmatch.fnmatch(file_path.name, exclude):
-            continue
-        
+        regex = re.compile(re.escape(pattern_bytes), re.IGNORECASE | re.MULTILINE)
+
+    include_match = re.compile(fnmatch.translate(include)).match
+    exclude_match = re.compile(fnmatch.translate(exclude)).match if exclude else None
+
+    # Gather candidate files first, then scan them in parallel
+    paths = []
+    stack = [path]
+
+    while stack:
+        current = stack.pop()
+
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                for line_num, line in enumerate(f, 1):
-                    if regex.search(line):
-                        results.append({
-                            "file": str(file_path),
-                            "line": line_num,
-                            "content": line,
-                        })
-        except (OSError, IOError, PermissionError):
+            entries = _walk_cache.scandir(current)
+        except (OSError, IOError):
             continue
-    
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+            except (OSError, IOError):
+                continue
+
+            if not include_match(entry.name):
+                continue
+            if exclude_match and exclude_match(entry.name):
+                continue
+
+            paths.append(entry.path)
+
+    if not paths:
+        return []
+
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) * 2
+
+    results = []
+
+    if hs_db is not None:
+        # Hyperscan scratch space is not thread-safe, so this path scans
+        # sequentially; the single-pass DFA more than makes up for it
+        for file_path in paths:
+            results.extend(_scan_file_hyperscan(file_path, hs_db, text_only=text_only))
+        return results
+
+    scan = functools.partial(_scan_file, regex=regex, text_only=text_only)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for matches in executor.map(scan, paths):
+            results.extend(matches)
+
     return results
 
 
-def _parse_size_filter(size_str: str) -> tuple:
+def _scan_file(
+    file_path: str,
+    regex: "re.Pattern[bytes]",
+    text_only: bool = True,
+) -> List[Dict[str, Any]]:
+    """Scan a single file for a compiled bytes regex.
+
+    Memory-maps the file and runs the regex over the raw bytes, so the
+    match loop runs in C with no per-line iteration or decoding. Line
+    numbers are derived by counting newlines up to each match offset.
+
+    Returns:
+        List of match dictionaries with file, line number, and content
+    """
+    matches = []
+
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except (OSError, IOError):
+        return matches
+
+    try:
+        try:
+            mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        except (OSError, ValueError):
+            # Empty or unmappable file
+            return matches
+
+        with mm:
+            # Binary heuristic: a NUL byte in the head means skip the file
+            if text_only and b"\x00" in mm[:8192]:
+                return matches
+
+            # Matches arrive in offset order, so count newlines incrementally
+            # between matches instead of rescanning from the start each time.
+            # One result per line: further matches on the same line are folded
+            # into the first, as the per-line loop did.
+            line_num = 1
+            counted_to = 0
+            last_line_start = -1
+
+            for m in regex.finditer(mm):
+                line_num += mm[counted_to:m.start()].count(b"\n")
+                counted_to = m.start()
+                line_start = mm.rfind(b"\n", 0, m.start()) + 1
+                if line_start == last_line_start:
+                    continue
+                last_line_start = line_start
+                line_end = mm.find(b"\n", m.end())
+                if line_end == -1:
+                    line_end = len(mm)
+                else:
+                    line_end += 1  # keep the trailing newline, as readline did
+                matches.append({
+                    "file": file_path,
+                    "line": line_num,
+                    "content": mm[line_start:line_end].decode("utf-8", errors="ignore"),
+                })
+    finally:
+        os.close(fd)
+
+    return matches
+
+
+# Two-character operators, looked up by prefix in one shot
+_TWO_CHAR_OPS = frozenset((">=", "<="))
+
+# Longest suffix first so KB/MB/... are tried before the bare B
+_SIZE_UNITS = (
+    ("KB", 1024),
+    ("MB", 1024 ** 2),
+    ("GB", 1024 ** 3),
+    ("TB", 1024 ** 4),
+    ("B", 1),
+)
+
+
+def _parse_size_filter(size_str: str):
     """Parse size filter string like '>1MB' or '<100KB'.
-    
+
     Returns:
-        Tuple of (operator, size_in_bytes)
+        Predicate taking a size in bytes; the comparator and threshold
+        are baked in at parse time, so the per-file check is one call
+        and one C-level compare
     """
     size_str = size_str.strip().upper()
-    
-    units = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024 ** 2,
-        "GB": 1024 ** 3,
-        "TB": 1024 ** 4,
-    }
-    
+
     # Extract operator and value
-    if size_str.startswith(">="):
-        op = ">="
-        val_str = size_str[2:]
-    elif size_str.startswith("<="):
-        op = "<="
+    prefix = size_str[:2]
+    if prefix in _TWO_CHAR_OPS:
+        op = prefix
         val_str = size_str[2:]
-    elif size_str.startswith(">"):
-        op = ">"
-        val_str = size_str[1:]
-    elif size_str.startswith("<"):
-        op = "<"
+    elif size_str[:1] in ("<", ">"):
+        op = size_str[0]
         val_str = size_str[1:]
     else:
         op = ">"
         val_str = size_str
-    
-    # Extract number and unit
-    for unit, multiplier in sorted(units.items(), key=lambda x: -len(x[0])):
+
+    # Extract number and unit; no unit means bytes
+    threshold = 0
+    for unit, multiplier in _SIZE_UNITS:
         if val_str.endswith(unit):
             try:
-                value = float(val_str[:-len(unit)])
-                return (op, int(value * multiplier))
+                threshold = int(float(val_str[:-len(unit)]) * multiplier)
             except ValueError:
-                break
-    
-    # No unit, assume bytes
+                pass
+            break
+    else:
+        try:
+            threshold = int(val_str)
+        except ValueError:
+            pass
+
+    op_func = _OP_FUNCS[op]
+    return lambda size, _op=op_func, _threshold=threshold: _op(size, _threshold)
+
+
+def _compile_hyperscan(patterns: List[str]):
+    """Compile patterns into a Hyperscan database.
+
+    Returns:
+        Compiled database, or None if compilation fails (unsupported
+        construct, etc.); callers fall back to the re path
+    """
+    try:
+        flags = (
+            hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_MULTILINE
+            | hyperscan.HS_FLAG_SOM_LEFTMOST
+        )
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns),
+        )
+        return db
+    except Exception:
+        # Hyperscan rejects some re constructs (backrefs, lookaround)
+        return None
+
+
+def _scan_file_hyperscan(file_path: str, db, text_only: bool = True) -> List[Dict[str, Any]]:
+    """Scan a single file with a compiled Hyperscan database.
+
+    Same contract as _scan_file; all patterns are matched in one pass
+    over the mapped bytes.
+    """
+    matches: List[Dict[str, Any]] = []
+
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except (OSError, IOError):
+        return matches
+
     try:
-        return (op, int(val_str))
-    except ValueError:
-        return (">", 0)
-
-
-def _matches_size(file_size: int, filter_tuple: tuple) -> bool:
-    """Check if file size matches the filter criteria."""
-    op, threshold = filter_tuple
-    
-    if op == ">":
-        return file_size > threshold
-    elif op == ">=":
-        return file_size >= threshold
-    elif op == "<":
-        return file_size < threshold
-    elif op == "<=":
-        return file_size <= threshold
-    
-    return False
+        try:
+            mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        except (OSError, ValueError):
+            # Empty or unmappable file
+            return matches
+
+        with mm:
+            if text_only and b"\x00" in mm[:8192]:
+                return matches
+
+            spans = []
+
+            def _on_match(pattern_id, start, end, match_flags, context):
+                spans.append((start, end))
+
+            try:
+                db.scan(mm, match_event_handler=_on_match)
+            except Exception:
+                return matches
+
+            spans.sort()
+            line_num = 1
+            counted_to = 0
+            last_line_start = -1
+
+            for start, end in spans:
+                line_num += mm[counted_to:start].count(b"\n")
+                counted_to = start
+                line_start = mm.rfind(b"\n", 0, start) + 1
+                if line_start == last_line_start:
+                    continue
+                last_line_start = line_start
+                line_end = mm.find(b"\n", end)
+                if line_end == -1:
+                    line_end = len(mm)
+                else:
+                    line_end += 1
+                matches.append({
+                    "file": file_path,
+                    "line": line_num,
+                    "content": mm[line_start:line_end].decode("utf-8", errors="ignore"),
+                })
+    finally:
+        os.close(fd)
+
+    return matches
+
+
+# Comparators baked into the size predicate at parse time
+_OP_FUNCS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}